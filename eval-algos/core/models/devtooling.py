@@ -736,6 +736,20 @@ def load_config(config_path: str) -> Tuple[DataSnapshot, SimulationConfig]:
     with open(config_path, 'r') as f:
         config = yaml.safe_load(f)
 
+    return load_config_from_dict(config)
+
+
+def load_config_from_dict(config: Dict[str, Any]) -> Tuple[DataSnapshot, SimulationConfig]:
+    """
+    Builds configuration objects from an already-parsed YAML dict, so callers
+    that have parsed the file for other reasons don't parse it twice.
+
+    Args:
+        config (Dict[str, Any]): Parsed YAML configuration.
+
+    Returns:
+        Tuple[DataSnapshot, SimulationConfig]: The loaded DataSnapshot and SimulationConfig objects.
+    """
     data_snapshot = DataSnapshot(
         data_dir=config['data_snapshot']['data_dir'],
         onchain_projects_file=config['data_snapshot']['onchain_projects'],
@@ -749,6 +763,15 @@ def load_config(config_path: str) -> Tuple[DataSnapshot, SimulationConfig]:
     return data_snapshot, simulation_config
 
 
+def read_table(path: str) -> pd.DataFrame:
+    """
+    Reads a snapshot file, dispatching on extension (Parquet or CSV).
+    """
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
 def load_data(data_snapshot: DataSnapshot) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, Dict[str, str]]:
     """
     Loads data files specified in the DataSnapshot.
@@ -763,11 +786,11 @@ def load_data(data_snapshot: DataSnapshot) -> Tuple[pd.DataFrame, pd.DataFrame,
     def get_path(filename: str) -> str:
         return os.path.join(data_snapshot.data_dir, filename)
 
-    df_onchain_projects = pd.read_csv(get_path(data_snapshot.onchain_projects_file))
-    df_devtooling_projects = pd.read_csv(get_path(data_snapshot.devtooling_projects_file))
-    df_project_dependencies = pd.read_csv(get_path(data_snapshot.project_dependencies_file))
-    
-    df_developers_to_projects = pd.read_csv(get_path(data_snapshot.developers_to_projects_file))
+    df_onchain_projects = read_table(get_path(data_snapshot.onchain_projects_file))
+    df_devtooling_projects = read_table(get_path(data_snapshot.devtooling_projects_file))
+    df_project_dependencies = read_table(get_path(data_snapshot.project_dependencies_file))
+
+    df_developers_to_projects = read_table(get_path(data_snapshot.developers_to_projects_file))
     if 'event_month' in df_developers_to_projects.columns:
         df_developers_to_projects['event_month'] = pd.to_datetime(df_developers_to_projects['event_month'])
     elif 'bucket_month' in df_developers_to_projects.columns:
@@ -779,7 +802,7 @@ def load_data(data_snapshot: DataSnapshot) -> Tuple[pd.DataFrame, pd.DataFrame,
     utility_label_map = {}
     if data_snapshot.utility_labels_file:
         try:
-            df_utility_labels = pd.read_csv(get_path(data_snapshot.utility_labels_file))
+            df_utility_labels = read_table(get_path(data_snapshot.utility_labels_file))
             df_joined = pd.merge(
                 df_utility_labels,
                 df_devtooling_projects[['project_id', 'project_name']],
@@ -795,17 +818,22 @@ def load_data(data_snapshot: DataSnapshot) -> Tuple[pd.DataFrame, pd.DataFrame,
             utility_label_map)
 
 
-def run_simulation(config_path: str) -> Dict[str, Any]:
+def run_simulation(config_path: str, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Runs the complete simulation pipeline for devtooling trust score calculation.
 
     Args:
         config_path (str): Path to the YAML configuration file.
+        config (Dict[str, Any], optional): Pre-parsed YAML config; when given,
+            the file at config_path is not re-read.
 
     Returns:
         Dict[str, Any]: Analysis dictionary including all intermediate outputs and final results.
     """
-    data_snapshot, simulation_config = load_config(config_path)
+    if config is not None:
+        data_snapshot, simulation_config = load_config_from_dict(config)
+    else:
+        data_snapshot, simulation_config = load_config(config_path)
     data = load_data(data_snapshot)
     calculator = DevtoolingCalculator(simulation_config)
     analysis = calculator.run_analysis(*data, data_snapshot)
@@ -1,4 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+import functools
 import numpy as np
 import pandas as pd
 import traceback
@@ -7,6 +9,79 @@ import yaml
 import warnings
 import os
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the numpy path below is used instead
+    njit = None
+
+
+# ------------------------------------------------------------------------
+# Row-wise power mean
+# ------------------------------------------------------------------------
+
+def _power_mean_rows_numpy(mat: np.ndarray, p: int = 2) -> np.ndarray:
+    """NaN-aware power mean of each row, computed with numpy reductions."""
+    counts = np.count_nonzero(~np.isnan(mat), axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scores = (np.nansum(mat ** p, axis=1) / counts) ** (1.0 / p)
+    return np.where(counts > 0, scores, np.nan)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _power_mean_rows_numba(mat, p):  # pragma: no cover - exercised when numba is installed
+        n_rows, n_cols = mat.shape
+        out = np.empty(n_rows)
+        for i in prange(n_rows):
+            total = 0.0
+            count = 0
+            for j in range(n_cols):
+                x = mat[i, j]
+                if not np.isnan(x):
+                    total += x ** p
+                    count += 1
+            out[i] = (total / count) ** (1.0 / p) if count > 0 else np.nan
+        return out
+
+
+def _power_mean_rows(mat: np.ndarray, p: int = 2) -> np.ndarray:
+    """
+    NaN-aware power mean of each row.
+
+    Uses a compiled parallel kernel when numba is installed, fusing the
+    pow/sum/count/root passes into one loop over the matrix; otherwise falls
+    back to the equivalent numpy reductions. fastmath is deliberately left
+    off so the NaN checks survive compilation.
+    """
+    if njit is not None:
+        return _power_mean_rows_numba(np.ascontiguousarray(mat, dtype=np.float64), p)
+    return _power_mean_rows_numpy(mat, p)
+
+
+# ------------------------------------------------------------------------
+# Percentile via quickselect
+# ------------------------------------------------------------------------
+
+def _nan_percentile_partition(values: np.ndarray, percentile: float) -> float:
+    """
+    Linear-interpolated percentile of the non-NaN values via quickselect.
+
+    np.partition is O(N) average versus the O(N log N) sort inside
+    np.(nan)percentile; selecting the two bracketing order statistics and
+    interpolating reproduces the default 'linear' result exactly.
+    """
+    values = values[~np.isnan(values)]
+    n = values.size
+    if n == 0:
+        return np.nan
+    pos = (percentile / 100.0) * (n - 1)
+    lo = int(np.floor(pos))
+    hi = int(np.ceil(pos))
+    part = np.partition(values, [lo, hi])
+    if lo == hi:
+        return float(part[lo])
+    return float(part[lo] + (part[hi] - part[lo]) * (pos - lo))
+
 
 # ------------------------------------------------------------------------
 # Dataclass Definitions
@@ -32,10 +107,11 @@ class SimulationConfig:
     chains: Dict[str, float]
     metrics: Dict[str, float]
     metric_variants: Dict[str, float]
-    tvl_minimum: float = 0 
+    tvl_minimum: float = 0
     tvl_maximum: float = 0
     eligibility_filter: bool = False
     percentile_cap: float = 100
+    debug_intermediates: bool = False
 
 
 # ------------------------------------------------------------------------
@@ -51,9 +127,35 @@ class OnchainBuildersCalculator:
     def __init__(self, config: SimulationConfig):
         """
         Initialize the calculator with simulation configuration and an empty analysis dictionary.
+
+        The metric/variant ordering and the combined metric x variant weight
+        matrix are invariant for the life of the calculator, so they are
+        derived from the config once here instead of being rebuilt from the
+        YAML dicts on every weighting pass.
         """
         self.config = config
         self.analysis = {}
+        # Dense (n_projects, n_metrics) float32 matrix per period, filled in
+        # by Step 2 so later steps index plain arrays instead of MultiIndex
+        # column labels.
+        self._period_matrices = {}
+        self._metric_order = [metric for metric, weight in config.metrics.items() if weight > 0]
+        self._variant_order = ['adoption', 'growth', 'retention']
+        # A variant absent from the config keeps a factor of 1.0, matching
+        # the historical behavior of skipping the multiply for it.
+        self._weights_mat = np.array([
+            [config.metrics[metric] * config.metric_variants[variant]
+             if variant in config.metric_variants else 1.0
+             for variant in self._variant_order]
+            for metric in self._metric_order
+        ])
+        # Flat output names for the known (metric, variant) column space;
+        # _flatten_columns falls back to its generic rules for anything else.
+        self._flat_map = {
+            (metric, variant): f"{metric.lower().replace(' ', '_')}_{variant.lower()}_variant"
+            for metric in config.metrics
+            for variant in config.metric_variants
+        }
 
     def run_analysis(self, df_data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
@@ -74,10 +176,15 @@ class OnchainBuildersCalculator:
         # Execute pipeline steps
         self._filter_and_pivot_raw_metrics_by_chain()
         self._sum_and_weight_raw_metrics_by_chain()
-        self._calculate_metric_variants()
-        self._normalize_metric_variants()
-        self._apply_weights_to_metric_variants()
-        self._aggregate_metric_variants()
+        if self.config.debug_intermediates:
+            # Step-by-step path: materializes every intermediate DataFrame
+            # (including normalized_metric_variants) for inspection.
+            self._calculate_metric_variants()
+            self._normalize_metric_variants()
+            self._apply_weights_to_metric_variants()
+            self._aggregate_metric_variants()
+        else:
+            self._compute_scores_fast()
         self._prepare_final_results()
 
         return self.analysis
@@ -99,39 +206,46 @@ class OnchainBuildersCalculator:
             all_metrics.append(tvl_metric)
         
         periods_list = list(self.config.periods.values())
-        
-        # First, create the basic pivot
+
+        # First, create the basic pivot. A groupby+unstack is equivalent to
+        # pivot_table(aggfunc='sum') but takes the fast Cython groupby path
+        # and skips materializing pivot_table's intermediate frame.
+        mask = df['metric_name'].isin(all_metrics) & df['measurement_period'].isin(periods_list)
         pivoted = (
-            df.query("metric_name in @all_metrics and measurement_period in @periods_list")
-              .pivot_table(
-                  index=['project_id', 'project_name', 'display_name', 'chain'],
-                  columns=['measurement_period', 'metric_name'],
-                  values='amount',
-                  aggfunc='sum'
-              )
+            df.loc[mask, ['project_id', 'project_name', 'display_name', 'chain',
+                          'measurement_period', 'metric_name', 'amount']]
+              .groupby(['project_id', 'project_name', 'display_name', 'chain',
+                        'measurement_period', 'metric_name'], observed=True, sort=False)['amount']
+              .sum()
+              .unstack(['measurement_period', 'metric_name'])
+              .sort_index()
         )
+        # Categorical group keys speed up the groupby above, but plain
+        # labels keep column selection/reindexing downstream on the normal
+        # Index paths.
+        pivoted.columns = pd.MultiIndex.from_tuples(
+            pivoted.columns.to_flat_index(), names=pivoted.columns.names)
 
-       # If TVL minimum is set, apply it to TVL metrics
+        # If TVL minimum is set, apply it to TVL metrics
         if hasattr(self.config, 'tvl_minimum') and self.config.tvl_minimum > 0:
-            # Calculate total TVL per project and period
             tvl_metrics = [m for m in non_zero_metrics if 'tvl' in m.lower()]
-            for period in periods_list:
-                if tvl_metrics:
-                    # Sum TVL across all chains for each project
-                    total_tvl = (
-                        pivoted[period]
-                        .reset_index()
-                        .groupby('project_id')[tvl_metrics]
-                        .sum()
-                    )
-                    
-                    # Create a mask for projects below TVL minimum
-                    below_min = (total_tvl < self.config.tvl_minimum).any(axis=1)
-                    
-                    # Set TVL metrics to null for projects below minimum
-                    for metric in tvl_metrics:
-                        mask = pivoted.index.get_level_values('project_id').isin(below_min[below_min].index)
-                        pivoted.loc[mask, (period, metric)] = np.nan
+            if tvl_metrics:
+                # Sum TVL across all chains for each project, aligned back to
+                # the pivot rows via a groupby-transform; then null all TVL
+                # cells of any (project, period) below the minimum in one
+                # vectorized assignment instead of a per-(period, metric)
+                # .loc loop.
+                tvl_block = pivoted.loc[:, pd.IndexSlice[:, tvl_metrics]]
+                project_tvl = tvl_block.groupby(level='project_id', observed=True).transform('sum')
+                below_min = (
+                    (project_tvl < self.config.tvl_minimum)
+                    .T.groupby(level='measurement_period', observed=True).any().T
+                )
+                cell_mask = below_min.reindex(columns=tvl_block.columns,
+                                              level='measurement_period')
+                tvl_col_idx = [pivoted.columns.get_loc(col) for col in tvl_block.columns]
+                pivoted.iloc[:, tvl_col_idx] = np.where(
+                    cell_mask.to_numpy(), np.nan, tvl_block.to_numpy())
         
         self.analysis["pivoted_raw_metrics_by_chain"] = pivoted
 
@@ -152,12 +266,46 @@ class OnchainBuildersCalculator:
         df = self.analysis.get("pivoted_raw_metrics_by_chain")
         if df is None:
             raise ValueError("Pivoted raw metrics not found. Check Step 1.")
-        weighted_df = (
-            df.mul(df.index.get_level_values('chain').map(chain_weights).fillna(1.0), axis=0)
-              .groupby(['project_id', 'project_name', 'display_name'])
-              .sum()
-        )
+        group_levels = ['project_id', 'project_name', 'display_name']
+        if df.empty:
+            weighted_df = df.groupby(group_levels, observed=True).sum().astype(np.float32)
+        else:
+            # Step 1 sorts the pivot, so rows of a project are contiguous and
+            # the groupby-sum reduces to one run-length reduction: scale each
+            # row by its chain weight, then np.add.reduceat over the run
+            # boundaries. NaNs become 0 first, matching groupby's skipna sum.
+            # The chain set is tiny, so one lookup vector indexed by category
+            # code replaces a per-row hashed map (unknown chains weight 1.0).
+            chain_level = df.index.get_level_values('chain')
+            if not isinstance(chain_level, pd.CategoricalIndex):
+                chain_level = chain_level.astype('category')
+            lookup = np.array([chain_weights.get(chain, 1.0)
+                               for chain in chain_level.categories], dtype=float)
+            weights = lookup[chain_level.codes]
+            scaled = np.nan_to_num(df.to_numpy(dtype=float)) * weights[:, None]
+            level_codes = [df.index.codes[df.index.names.index(level)]
+                           for level in group_levels]
+            change = np.zeros(len(df) - 1, dtype=bool)
+            for codes in level_codes:
+                change |= codes[1:] != codes[:-1]
+            breaks = np.concatenate(([0], np.flatnonzero(change) + 1))
+            group_index = pd.MultiIndex.from_arrays(
+                [df.index.get_level_values(level)[breaks] for level in group_levels],
+                names=group_levels)
+            weighted_df = pd.DataFrame(
+                np.add.reduceat(scaled, breaks, axis=0),
+                index=group_index, columns=df.columns
+            # Everything downstream is normalized values in [0, ~1];
+            # float32 halves the memory traffic of Steps 3-6 with far more
+            # precision than those steps need.
+            ).astype(np.float32)
         self.analysis["pivoted_raw_metrics_weighted_by_chain"] = weighted_df
+        self._period_matrices = {
+            period: weighted_df[period].reindex(columns=self._metric_order)
+                                       .to_numpy(dtype=np.float32)
+            for period in self.config.periods.values()
+            if period in weighted_df.columns.get_level_values(0)
+        }
 
     # --------------------------------------------------------------------
     # Step 3: Calculate metric variants
@@ -187,9 +335,15 @@ class OnchainBuildersCalculator:
         for metric in non_zero_metrics:
             current_vals = df[(current_period, metric)]
             prev_vals = df[(previous_period, metric)]
+            cur = current_vals.to_numpy()
+            prev = prev_vals.to_numpy()
             variant_scores[(metric, 'adoption')] = current_vals
-            variant_scores[(metric, 'growth')] = (current_vals - prev_vals).clip(lower=0)
-            variant_scores[(metric, 'retention')] = pd.concat([current_vals, prev_vals], axis=1).min(axis=1)
+            variant_scores[(metric, 'growth')] = pd.Series(
+                np.maximum(cur - prev, 0), index=df.index)
+            # np.fmin matches the NaN-skipping semantics of .min(axis=1)
+            # without allocating a two-column frame first
+            variant_scores[(metric, 'retention')] = pd.Series(
+                np.fmin(cur, prev), index=df.index)
 
         self.analysis["pivoted_metric_variants"] = pd.DataFrame(variant_scores)
 
@@ -209,9 +363,28 @@ class OnchainBuildersCalculator:
         df = self.analysis.get("pivoted_metric_variants")
         if df is None:
             raise ValueError("Metric variants not computed. Check Step 3.")
-        df_norm = df.copy()
-        for col in df_norm.columns:
-            df_norm[col] = OnchainBuildersCalculator._minmax_scale(df_norm[col].values, self.config.percentile_cap)
+        values = df.to_numpy(dtype=float, copy=True)
+        if values.size:
+            # Single 2-D pass over all variant columns at once. The nan-aware
+            # reductions skip nulls instead of poisoning a whole column, so
+            # nulls really are preserved as the docstring promises.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                if self.config.percentile_cap < 100:
+                    caps = np.array(
+                        [_nan_percentile_partition(values[:, j], self.config.percentile_cap)
+                         for j in range(values.shape[1])], dtype=values.dtype)
+                    values = np.minimum(values, caps)
+                mins = np.nanmin(values, axis=0)
+                maxs = np.nanmax(values, axis=0)
+            rng = maxs - mins
+            constant = rng == 0
+            rng[constant] = 1.0
+            values = (values - mins) / rng
+            if constant.any():
+                # Constant columns scale to 1.0, matching _minmax_scale
+                values[:, constant] = np.where(np.isnan(values[:, constant]), np.nan, 1.0)
+        df_norm = pd.DataFrame(values, index=df.index, columns=df.columns)
         self.analysis["normalized_metric_variants"] = df_norm
 
     # --------------------------------------------------------------------
@@ -230,11 +403,16 @@ class OnchainBuildersCalculator:
         df = self.analysis.get("normalized_metric_variants")
         if df is None:
             raise ValueError("Normalized metric variants not available. Check Step 4.")
-        df_weighted = df.copy()
-        for metric, m_weight in self.config.metrics.items():
-            for variant, v_weight in self.config.metric_variants.items():
-                if (metric, variant) in df_weighted.columns:
-                    df_weighted[(metric, variant)] *= (m_weight * v_weight)
+        # One broadcast multiply instead of a per-column Python loop; columns
+        # without a configured metric/variant weight keep a factor of 1.0,
+        # as before.
+        col_weights = np.array([
+            self.config.metrics[metric] * self.config.metric_variants[variant]
+            if metric in self.config.metrics and variant in self.config.metric_variants else 1.0
+            for metric, variant in df.columns
+        ])
+        df_weighted = pd.DataFrame(df.to_numpy(dtype=float) * col_weights,
+                                   index=df.index, columns=df.columns)
         self.analysis["weighted_metric_variants"] = df_weighted
 
     # --------------------------------------------------------------------
@@ -257,17 +435,95 @@ class OnchainBuildersCalculator:
         df = self.analysis.get("weighted_metric_variants")
         if df is None:
             raise ValueError("Weighted metric variants not available. Check Step 5.")
-        df_agg = df.copy()
+        # Shallow copy: copy-on-write means adding the score column below
+        # doesn't touch Step 5's stored frame, so the variant matrix itself
+        # is never duplicated.
+        df_agg = df.copy(deep=False)
         if method == 'power_mean':
-            p = 2
-            counts = df_agg.notna().sum(axis=1)
-            df_agg['project_score'] = ((df_agg.pow(p).sum(axis=1, skipna=True) / counts)**(1 / p)).where(counts > 0)
+            df_agg['project_score'] = _power_mean_rows(df_agg.to_numpy(dtype=float), p=2)
         elif method == 'sum':
             df_agg['project_score'] = df_agg.sum(axis=1, skipna=True)
         else:
             raise ValueError(f"Invalid aggregation method: {method}")
         self.analysis["aggregated_project_scores"] = df_agg
 
+    # --------------------------------------------------------------------
+    # Steps 3-6 fused: variants + normalization + weights + aggregation
+    # --------------------------------------------------------------------
+    def _compute_scores_fast(self) -> None:
+        """
+        Computes Steps 3-6 in a single NumPy kernel over the weighted matrix.
+
+        The adoption/growth/retention variants are stacked into one (N, M, 3)
+        tensor, then normalization, weighting, and the p=2 power mean all run
+        on that one contiguous buffer instead of copying a multi-indexed
+        DataFrame at every step. Results match the step-by-step path; set
+        `debug_intermediates` in the simulation config to run the individual
+        steps (and keep normalized_metric_variants) instead.
+
+        Outputs stored in:
+            self.analysis["pivoted_metric_variants"]
+            self.analysis["weighted_metric_variants"]
+            self.analysis["aggregated_project_scores"]
+
+        Raises:
+            ValueError: If weighted metrics are not available from Step 2.
+        """
+        df = self.analysis.get("pivoted_raw_metrics_weighted_by_chain")
+        if df is None:
+            raise ValueError("Weighted metrics not found. Check Step 2.")
+        current_period = self.config.periods.get('current')
+        previous_period = self.config.periods.get('previous')
+        metrics = self._metric_order
+        columns = pd.MultiIndex.from_tuples(
+            [(metric, variant) for metric in metrics for variant in self._variant_order]
+        )
+
+        cur = self._period_matrices[current_period]
+        prev = self._period_matrices[previous_period]
+
+        # Variant stack: adoption = current, growth = positive delta,
+        # retention = nan-skipping min of the two periods (np.fmin matches
+        # the pandas min-with-skipna semantics of the step-by-step path).
+        # Forcing C order guarantees the 2-D reshape below is a view, so all
+        # subsequent in-place ops run on one shared buffer.
+        variants = np.ascontiguousarray(
+            np.stack([cur, np.maximum(cur - prev, 0), np.fmin(cur, prev)], axis=-1))
+        values = variants.reshape(len(df), -1)
+        self.analysis["pivoted_metric_variants"] = pd.DataFrame(
+            values.copy(), index=df.index, columns=columns)
+
+        # Normalize each (metric, variant) column in place (see Step 4)
+        if values.size:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                if self.config.percentile_cap < 100:
+                    caps = np.array(
+                        [_nan_percentile_partition(values[:, j], self.config.percentile_cap)
+                         for j in range(values.shape[1])], dtype=values.dtype)
+                    np.minimum(values, caps, out=values)
+                mins = np.nanmin(values, axis=0)
+                maxs = np.nanmax(values, axis=0)
+            rng = maxs - mins
+            constant = rng == 0
+            rng[constant] = 1.0
+            values -= mins
+            values /= rng
+            if constant.any():
+                values[:, constant] = np.where(np.isnan(values[:, constant]), np.nan, 1.0)
+
+        # Apply metric x variant weights in one broadcast (see Step 5)
+        values *= self._weights_mat.reshape(1, -1)
+        df_weighted = pd.DataFrame(values, index=df.index, columns=columns, copy=False)
+        self.analysis["weighted_metric_variants"] = df_weighted
+
+        # p=2 power mean across all weighted variants (see Step 6)
+        scores = _power_mean_rows(values, p=2)
+
+        df_agg = pd.DataFrame(values, index=df.index, columns=columns, copy=False)
+        df_agg['project_score'] = scores
+        self.analysis["aggregated_project_scores"] = df_agg
+
     # --------------------------------------------------------------------
     # Step 7: Prepare final results
     # --------------------------------------------------------------------
@@ -293,7 +549,10 @@ class OnchainBuildersCalculator:
         if hasattr(self.config, 'tvl_maximum') and self.config.tvl_maximum > 0:
             scores_series = self._apply_tvl_maximum_filter(scores_series, df_pivoted_weighted)
         
-        normalized_series = scores_series / scores_series.sum() if scores_series.sum() != 0 else scores_series
+        # One reduction for the total, one multiply by its reciprocal —
+        # instead of summing the series twice and dispatching a division.
+        total = float(np.nansum(scores_series.to_numpy()))
+        normalized_series = scores_series * (1.0 / total) if total else scores_series.copy()
         normalized_series.name = 'weighted_score'
 
         final_df = (
@@ -364,8 +623,10 @@ class OnchainBuildersCalculator:
                 else:
                     return "_".join(str(x).lower().replace(' ', '_') for x in col)
             return str(col).lower().replace(' ', '_')
-        out = df.copy()
-        out.columns = [_flat(c) for c in df.columns]
+        # Shallow copy: only the column axis changes, so the data blocks are
+        # shared with the input frame.
+        out = df.copy(deep=False)
+        out.columns = [self._flat_map.get(c) or _flat(c) for c in df.columns]
         return out
 
     # --------------------------------------------------------------------
@@ -418,6 +679,21 @@ def load_config(config_path: str) -> Tuple[DataSnapshot, SimulationConfig]:
     with open(config_path, 'r') as f:
         ycfg = yaml.safe_load(f)
 
+    return load_config_from_dict(ycfg, config_path)
+
+
+def load_config_from_dict(ycfg: Dict[str, Any], config_path: str) -> Tuple[DataSnapshot, SimulationConfig]:
+    """
+    Builds configuration objects from an already-parsed YAML dict, so callers
+    that have parsed the file for other reasons don't parse it twice.
+
+    Args:
+        ycfg (Dict[str, Any]): Parsed YAML configuration.
+        config_path (str): Path to the source YAML file (used for naming outputs).
+
+    Returns:
+        Tuple[DataSnapshot, SimulationConfig]: A tuple containing the DataSnapshot and SimulationConfig objects.
+    """
     yaml_name = config_path.split('/')[-1]
     ds = DataSnapshot(
         data_dir=ycfg['data_snapshot'].get('data_dir', "eval-algos/S8/data/onchain_testing"),
@@ -435,15 +711,47 @@ def load_config(config_path: str) -> Tuple[DataSnapshot, SimulationConfig]:
         tvl_minimum=sim.get('tvl_minimum', 0),
         tvl_maximum=sim.get('tvl_maximum', 0),
         eligibility_filter=sim.get('eligibility_filter', False),
-        percentile_cap=sim.get('percentile_cap', 100)
+        percentile_cap=sim.get('percentile_cap', 100),
+        debug_intermediates=sim.get('debug_intermediates', False)
     )
 
     return ds, sc
 
 
+def read_table(path: str, columns: list = None) -> pd.DataFrame:
+    """
+    Reads a snapshot file, dispatching on extension (Parquet or CSV).
+
+    CSVs are parsed with the multithreaded pyarrow engine. When `columns` is
+    given, only those columns are materialized (columns missing from the
+    file are silently skipped), so discarded fields never allocate.
+    """
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path, columns=columns)
+    if columns is not None:
+        header = pd.read_csv(path, nrows=0)
+        columns = [c for c in columns if c in header.columns]
+    return pd.read_csv(path, engine='pyarrow', usecols=columns)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_table_cached(path: str, mtime_ns: int, columns: tuple) -> pd.DataFrame:
+    """
+    read_table memoized on (path, mtime), so batch sweeps that run many
+    weight configs against the same snapshot parse each file once. The
+    mtime key invalidates the entry whenever the file changes on disk.
+    """
+    return read_table(path, list(columns) if columns else None)
+
+
+def _read_table_fresh(path: str, columns: tuple) -> pd.DataFrame:
+    """Cached read returning a shallow copy, so callers can't mutate the cache."""
+    return _read_table_cached(path, os.stat(path).st_mtime_ns, columns).copy(deep=False)
+
+
 def load_data(ds: DataSnapshot) -> pd.DataFrame:
     """
-    Loads raw CSV data and merges it with project metadata if available.
+    Loads raw snapshot data and merges it with project metadata if available.
 
     Args:
         ds (DataSnapshot): DataSnapshot object with file location details.
@@ -455,14 +763,30 @@ def load_data(ds: DataSnapshot) -> pd.DataFrame:
         return os.path.join(ds.data_dir, filename)
 
     try:
-        df_projects = pd.read_csv(path(ds.projects_file))
-        df_metrics = pd.read_csv(path(ds.metrics_file))
+        df_projects = _read_table_fresh(path(ds.projects_file),
+                                        columns=('project_id', 'is_eligible'))
+        df_metrics = _read_table_fresh(path(ds.metrics_file),
+                                       columns=('project_id', 'project_name', 'display_name',
+                                                'chain', 'metric_name', 'sample_date',
+                                                'measurement_period', 'amount'))
     except FileNotFoundError as e:
         raise FileNotFoundError(f"Error loading data files: {e}")
 
     # Derive measurement_period if not present
     if 'measurement_period' not in df_metrics.columns:
         df_metrics['measurement_period'] = pd.to_datetime(df_metrics['sample_date']).dt.strftime('%b %Y')
+
+    # Raw amounts comfortably fit float32, and the whole scoring pipeline
+    # runs in float32 downstream.
+    if 'amount' in df_metrics.columns:
+        df_metrics['amount'] = df_metrics['amount'].astype(np.float32)
+
+    # Low-cardinality group keys as categories: the pivot's groupby then
+    # matches on integer codes instead of strings (observed=True there
+    # avoids the categorical cross-product).
+    for col in ('chain', 'metric_name', 'measurement_period'):
+        if col in df_metrics.columns:
+            df_metrics[col] = df_metrics[col].astype('category')
     
     cols = [c for c in df_projects.columns
             if c in ['project_id', 'is_eligible']]
@@ -473,17 +797,22 @@ def load_data(ds: DataSnapshot) -> pd.DataFrame:
 # Main Pipeline Entry-Point and Serialization
 # ------------------------------------------------------------------------
 
-def run_simulation(config_path: str) -> Dict[str, Any]:
+def run_simulation(config_path: str, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Runs the complete simulation pipeline.
 
     Args:
         config_path (str): Path to the YAML configuration file.
+        config (Dict[str, Any], optional): Pre-parsed YAML config; when given,
+            the file at config_path is not re-read.
 
     Returns:
         Dict[str, Any]: Analysis dictionary containing all intermediate outputs and final results.
     """
-    ds, sim_cfg = load_config(config_path)
+    if config is not None:
+        ds, sim_cfg = load_config_from_dict(config, config_path)
+    else:
+        ds, sim_cfg = load_config(config_path)
     df_data = load_data(ds)
     
     calculator = OnchainBuildersCalculator(sim_cfg)
@@ -496,6 +825,29 @@ def run_simulation(config_path: str) -> Dict[str, Any]:
     return analysis
 
 
+def run_batch(config_paths: list, max_workers: int = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Runs run_simulation for several YAML configs in parallel processes.
+
+    Each model is pure compute over its snapshot, so a sweep scales with
+    cores. On platforms that fork, a parent that has already loaded the
+    snapshot shares the memoized frames copy-on-write with the workers,
+    so the data is parsed once for the whole batch.
+
+    Args:
+        config_paths (list): Paths to the YAML configuration files.
+        max_workers (int, optional): Process count; defaults to one per
+            config up to the machine's CPU count.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Mapping of config path to its analysis.
+    """
+    max_workers = max_workers or min(len(config_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {path: executor.submit(run_simulation, path) for path in config_paths}
+        return {path: future.result() for path, future in futures.items()}
+
+
 def save_results(analysis: Dict[str, Any]) -> None:
     """
     Saves the final results to a CSV file and logs the output.
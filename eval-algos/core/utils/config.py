@@ -2,6 +2,18 @@ import os
 from pathlib import Path
 from typing import Dict
 
+# Directories already created by this process; batch loops re-saving into the
+# same output directory skip the repeated stat/mkdir syscalls
+_ensured_dirs = set()
+
+
+def ensure_dir(path: str) -> None:
+    """Create a directory (with parents) at most once per process."""
+    if path in _ensured_dirs:
+        return
+    Path(path).mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
 
 class SeasonConfig:
     """
@@ -85,7 +97,7 @@ class SeasonConfig:
         """
         paths = self.get_measurement_period_paths(measurement_period)
         for path in paths.values():
-            Path(path).mkdir(parents=True, exist_ok=True)
+            ensure_dir(path)
     
     def resolve_yaml_path(self, relative_path: str) -> str:
         """
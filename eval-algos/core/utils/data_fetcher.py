@@ -1,29 +1,43 @@
 import argparse
+import csv
+import hashlib
+import importlib
+import json
 import os
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any
-import pandas as pd
-from dotenv import load_dotenv
-from pyoso import Client
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from .config import SeasonConfig
+from .oso_client import get_oso_client
 
+# Number of rows written to disk per batch when streaming query results
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Number of queries submitted to OSO at the same time
+MAX_CONCURRENT_QUERIES = 8
 
 class DataFetcher:
     """
     Generic data fetcher that works for any season.
     """
-    
-    def __init__(self, season_config: SeasonConfig):
+
+    def __init__(self, season_config: SeasonConfig, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 use_cache: bool = True):
         self.config = season_config
-        self.client = self._init_oso_client()
-    
-    def _init_oso_client(self) -> Client:
-        load_dotenv()
-        api_key = os.environ.get('OSO_API_KEY')
-        if not api_key:
-            raise ValueError("OSO_API_KEY environment variable not set")
-        return Client(api_key=api_key)
+        self.chunk_size = chunk_size
+        self.use_cache = use_cache
+        self.cache_dir = os.path.join(season_config.project_root, '.cache', 'oso_queries')
+        self.client = get_oso_client()
     
     def get_output_path(self, measurement_period: str, filename: str, filetype: str) -> str:
         """Get the output path for a given measurement period and filename."""
@@ -38,76 +52,178 @@ class DataFetcher:
     
     def execute_query(self, query_obj: Dict[str, Any], measurement_period: str) -> None:
         """
-        Execute a query and save the results to a CSV or JSON file.
+        Execute a query and stream the results to a CSV or JSON file.
+
+        Rows are written incrementally in chunks of `self.chunk_size` rather
+        than materializing a full DataFrame, so peak memory stays proportional
+        to the chunk size even for multi-million-row result sets.
         """
         query_sql = query_obj["query"]
         filename = query_obj["filename"]
         filetype = query_obj.get("filetype", "csv")
         output_path = self.get_output_path(measurement_period, filename, filetype)
-        
+
+        # Serve from the local cache if this exact SQL has been fetched before.
+        # The rendered SQL embeds the period, dates, and flag lists, so any
+        # change to those constants produces a new cache key.
+        cache_path = self._get_cache_path(query_sql, filetype)
+        if self.use_cache and os.path.exists(cache_path):
+            shutil.copyfile(cache_path, output_path)
+            print(f"✓ Loaded {output_path} from cache")
+            return
+
         print(f"Executing query for {filename}...")
         try:
-            dataframe = self.client.to_pandas(query_sql)
-            
+            response = self.client.query(query_sql)
+            columns = response.data.columns
+            rows = response.data.data
+
             # Export based on filetype
             if filetype.lower() == "csv":
-                dataframe.to_csv(output_path, index=False)
+                self._write_csv(output_path, columns, rows)
             elif filetype.lower() == "json":
-                json_str = dataframe.to_json(orient='records', indent=2)
-                clean_json_str = json_str.replace('\\/', '/')
-                with open(output_path, 'w') as file:
-                    file.write(clean_json_str)
+                self._write_json(output_path, columns, rows)
+            elif filetype.lower() == "parquet":
+                self._write_parquet(output_path, columns, rows)
             else:
                 raise ValueError(f"Unsupported filetype: {filetype}")
-                
+
+            if self.use_cache:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                shutil.copyfile(output_path, cache_path)
+
             print(f"✓ Saved {output_path}")
         except Exception as e:
             print(f"✗ Error executing query for {filename}: {str(e)}")
+
+    def _get_cache_path(self, query_sql: str, filetype: str) -> str:
+        """Get the cache file path for a query, keyed by the SHA256 of its rendered SQL."""
+        key = hashlib.sha256(query_sql.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.{filetype}")
+
+    def _write_parquet(self, output_path: str, columns: List[str], rows: List[List[Any]]) -> None:
+        """
+        Write rows as a Parquet file with dictionary encoding and zstd compression.
+
+        Columnar storage avoids repeating project_id/metric_name strings on
+        every row and loads back with native dtypes, so downstream reads skip
+        CSV type inference entirely.
+        """
+        table = pa.table({col: [row[i] for row in rows] for i, col in enumerate(columns)})
+        pq.write_table(table, output_path, compression='zstd', use_dictionary=True)
+
+    def _write_csv(self, output_path: str, columns: List[str], rows: List[List[Any]]) -> None:
+        """
+        Write rows to CSV via PyArrow's multi-threaded C++ writer.
+
+        Falls back to the incremental stdlib writer when the rows hold mixed
+        types Arrow cannot convert to a single column type.
+        """
+        try:
+            table = pa.table({col: [row[i] for row in rows] for i, col in enumerate(columns)})
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            self._write_csv_chunked(output_path, columns, rows)
+            return
+        pacsv.write_csv(table, output_path,
+                        write_options=pacsv.WriteOptions(include_header=True))
+
+    def _write_csv_chunked(self, output_path: str, columns: List[str], rows: List[List[Any]]) -> None:
+        """Write rows to CSV incrementally, flushing after each chunk."""
+        with open(output_path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            for start in range(0, len(rows), self.chunk_size):
+                writer.writerows(rows[start:start + self.chunk_size])
+                file.flush()
+
+    def _write_json(self, output_path: str, columns: List[str], rows: List[List[Any]]) -> None:
+        """
+        Write rows as a JSON array of records without building the full string
+        in memory.
+
+        Records are encoded with orjson when it is installed (a C encoder,
+        several times faster than the stdlib), falling back to `json` otherwise.
+        NaN values are written as null; the stdlib encoder would otherwise
+        emit a bare `NaN` token that strict JSON parsers reject.
+        """
+        with open(output_path, 'wb') as file:
+            file.write(b'[')
+            for idx, row in enumerate(rows):
+                if idx:
+                    file.write(b',')
+                file.write(b'\n')
+                record = {col: None if isinstance(val, float) and val != val else val
+                          for col, val in zip(columns, row)}
+                if orjson is not None:
+                    file.write(orjson.dumps(record, option=orjson.OPT_INDENT_2, default=str))
+                else:
+                    file.write(json.dumps(record, indent=2, default=str).encode('utf-8'))
+            file.write(b'\n]')
     
     def fetch_data(self, measurement_period: str, queries: List[Dict[str, Any]]) -> None:
         """
         Fetch all data for a given measurement period.
+
+        The queries are independent, so they are submitted concurrently and
+        wall time is bounded by the slowest query rather than the sum of all
+        query latencies. Each query still streams into its own output file.
         """
         print(f"Fetching data for measurement period: {measurement_period}")
-        
+
         # Ensure all directories exist
         self.config.ensure_directories(measurement_period)
-        
-        # Execute all queries
-        for query in queries:
-            self.execute_query(query, measurement_period)
-        
+
+        # Execute all queries concurrently, waiting in submission order
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_QUERIES) as executor:
+            futures = [executor.submit(self.execute_query, query, measurement_period)
+                       for query in queries]
+            for future in futures:
+                future.result()
+
         print(f"Data fetch complete for {measurement_period}")
 
 
-def get_season_queries(season: str):
-    """
-    Get the appropriate season queries.
-    """
+@lru_cache(maxsize=None)
+def _season_query_module(season: str):
+    """Import (once) and cache the query module for a season."""
     if season == '7':
-        try:
-            from queries.s7_queries import QUERIES as query_instructions
-        except ImportError:
-            sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-            from queries.s7_queries import QUERIES as query_instructions
-        return query_instructions
+        module_name = 'queries.s7_queries'
     elif season == '8':
-        try:
-            from queries.s8_queries import QUERIES as query_instructions
-        except ImportError:
-            sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-            from queries.s8_queries import QUERIES as query_instructions
-        return query_instructions
+        module_name = 'queries.s8_queries'
     else:
         raise ValueError(f"Unsupported season: {season}")
 
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+        return importlib.import_module(module_name)
+
+
+@lru_cache(maxsize=None)
+def get_season_queries(season: str, measurement_period: str = None):
+    """
+    Get the appropriate season queries.
+
+    When the measurement period has a date preset in the season's query
+    module, the queries are built for that period; otherwise the module's
+    current-period default is used. Results are memoized, so repeated calls
+    (e.g. notebooks re-running the fetcher) skip both the module resolution
+    and the SQL rendering.
+    """
+    query_module = _season_query_module(season)
+    if measurement_period and measurement_period in query_module.PERIODS:
+        return query_module.build_queries(measurement_period)
+    return query_module.QUERIES
+
 
-def fetch_data(season: str, measurement_period: str, queries: List[Dict[str, Any]]) -> None:
+def fetch_data(season: str, measurement_period: str, queries: List[Dict[str, Any]],
+               chunk_size: int = DEFAULT_CHUNK_SIZE, use_cache: bool = True) -> None:
     """
     Convenience function to fetch data for a specific season.
     """
     config = SeasonConfig.get_season_config(season)
-    fetcher = DataFetcher(config)
+    fetcher = DataFetcher(config, chunk_size=chunk_size, use_cache=use_cache)
     fetcher.fetch_data(measurement_period, queries)
 
 
@@ -117,12 +233,17 @@ def main():
                        help='Season number (7 or 8)')
     parser.add_argument('--period', '-p', type=str, required=True,
                        help='Measurement period (e.g., M1, M2)')
-    
+    parser.add_argument('--chunk-size', '-c', type=int, default=DEFAULT_CHUNK_SIZE,
+                       help=f'Number of rows written per batch when streaming results (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always hit the warehouse, ignoring locally cached query results')
+
     args = parser.parse_args()
-    
+
     try:
-        queries = get_season_queries(args.season)
-        fetch_data(args.season, args.period, queries)
+        queries = get_season_queries(args.season, args.period)
+        fetch_data(args.season, args.period, queries, chunk_size=args.chunk_size,
+                   use_cache=not args.no_cache)
         
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -0,0 +1,23 @@
+"""
+Shared construction of the OSO API client.
+
+Every entry point that talks to the warehouse goes through
+`get_oso_client`, so one client (and its underlying connection pool) is
+shared per process instead of each utility building its own.
+"""
+
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+from pyoso import Client
+
+
+@lru_cache(maxsize=1)
+def get_oso_client() -> Client:
+    """Return the process-wide OSO client, loading .env on first use."""
+    load_dotenv()
+    api_key = os.environ.get('OSO_API_KEY')
+    if not api_key:
+        raise ValueError("OSO_API_KEY environment variable not set")
+    return Client(api_key=api_key)
@@ -4,14 +4,14 @@ import os
 import importlib.util
 import yaml
 import pandas as pd
-from pathlib import Path
+from functools import lru_cache
 
 # Add the current directory to the Python path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 eval_algos_dir = os.path.dirname(os.path.dirname(script_dir))
 sys.path.append(eval_algos_dir)
 
-from .config import get_model_yaml_path, get_output_path, ensure_directories
+from .config import ensure_dir, get_model_yaml_path, get_output_path, ensure_directories
 from ..models.allocator import allocate_with_constraints, AllocationConfig
 
 
@@ -21,6 +21,27 @@ MODEL_SCORE_COLUMNS = {
     'onchain': 'weighted_score'
 }
 
+# C-accelerated YAML loader (libyaml) when available, ~5-10x the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Dynamically loaded model modules, keyed by source path; exec_module re-parses
+# and re-executes the file (including its pandas/numpy imports), so batch runs
+# only pay that once per model
+_MODEL_CACHE = {}
+
+
+def _load_model(module_name: str, model_path: str):
+    """Load a model module from its source path, reusing a prior load."""
+    module = _MODEL_CACHE.get(model_path)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(module_name, model_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    _MODEL_CACHE[model_path] = module
+    return module
+
 
 def find_yaml_file(season: str, measurement_period: str, model_name: str) -> str:
     """
@@ -43,14 +64,33 @@ def find_yaml_file(season: str, measurement_period: str, model_name: str) -> str
     raise FileNotFoundError(f"YAML file not found: {model_name} or {model_name}.yaml")
 
 
-def load_allocation_config(yaml_path: str) -> AllocationConfig:
+def load_yaml_config(yaml_path: str) -> dict:
     """
-    Load allocation configuration from YAML file.
-    Raises ValueError if allocation config is missing or invalid.
+    Parse a model YAML file once; the resulting dict is shared by the model
+    simulation and the allocator so the file is never re-read.
     """
     with open(yaml_path, 'r') as f:
-        config = yaml.safe_load(f)
-    
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+@lru_cache(maxsize=None)
+def _resolve_model_config(season: str, measurement_period: str, model_name: str) -> tuple:
+    """
+    Resolve and parse a model YAML once per (season, period, model).
+
+    Batch runs sweeping many weights re-process the same model repeatedly;
+    memoizing here skips the existence probes and the YAML parse on every
+    call after the first. Returns (yaml_path, parsed_config).
+    """
+    yaml_path = find_yaml_file(season, measurement_period, model_name)
+    return yaml_path, load_yaml_config(yaml_path)
+
+
+def load_allocation_config(config: dict, yaml_path: str) -> AllocationConfig:
+    """
+    Extract allocation configuration from a parsed YAML config.
+    Raises ValueError if allocation config is missing or invalid.
+    """
     allocation_config = config.get('allocation')
     if not allocation_config:
         raise ValueError(f"No allocation configuration found in {yaml_path}")
@@ -68,16 +108,18 @@ def load_allocation_config(yaml_path: str) -> AllocationConfig:
     )
 
 
-def allocate_rewards(results: pd.DataFrame, yaml_path: str) -> pd.DataFrame:
+def allocate_rewards(results: pd.DataFrame, config: dict, yaml_path: str) -> pd.DataFrame:
     """
-    Allocate rewards using the allocation configuration from the YAML file.
+    Allocate rewards using the allocation configuration from the parsed YAML config.
     Returns DataFrame with project_id, project_name, display_name, score, and allocated_amount.
     """
     # Load allocation configuration
-    allocation_config = load_allocation_config(yaml_path)
+    allocation_config = load_allocation_config(config, yaml_path)
     
-    # Create score series for allocation
-    score_series = results.set_index('project_id')['score']
+    # Create score series for allocation directly from the column arrays;
+    # set_index would materialize a new index and re-copy the frame
+    project_ids = results['project_id'].to_numpy()
+    score_series = pd.Series(results['score'].to_numpy(), index=project_ids, copy=False)
     
     # Run allocation
     allocations = allocate_with_constraints(
@@ -86,16 +128,18 @@ def allocate_rewards(results: pd.DataFrame, yaml_path: str) -> pd.DataFrame:
         print_results=False
     )
     
-    # Create final results DataFrame
-    final_results = results.copy()
-    final_results['allocated_amount'] = final_results['project_id'].map(allocations)
-    
-    # Filter to only projects that received funding
-    funded_results = final_results[final_results['allocated_amount'] > 0].copy()
+    # Materialize the per-row allocations once and reuse the same array for
+    # the funded mask and the assigned column; .loc on a boolean mask already
+    # returns a new frame, so no intermediate copies are needed
+    alloc_arr = allocations.reindex(project_ids).to_numpy()
+    funded_mask = alloc_arr > 0
     
-    if funded_results.empty:
+    if not funded_mask.any():
         raise ValueError("No projects received funding after allocation")
     
+    funded_results = results.loc[funded_mask].reset_index(drop=True)
+    funded_results['allocated_amount'] = alloc_arr[funded_mask]
+    
     return funded_results
 
 
@@ -103,9 +147,9 @@ def save_rewards_csv(results: pd.DataFrame, season: str, measurement_period: str
     """Save rewards to CSV file and return the file path"""
     output_path = get_output_path(season, measurement_period, model_name)
     
-    # Ensure output directory exists
+    # Ensure output directory exists (memoized; no syscall on repeat saves)
     output_dir = os.path.dirname(output_path)
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_dir)
     
     # Save to CSV
     results.to_csv(output_path, index=False)
@@ -118,17 +162,15 @@ def process_devtooling(season: str, measurement_period: str, model_name: str) ->
     """Complete devtooling model workflow: execute, extract results, allocate, and save"""
     print(f"Processing devtooling model: {model_name}")
     
-    # Find YAML file
-    yaml_path = find_yaml_file(season, measurement_period, model_name)
-    
+    # Find and parse the YAML file once
+    yaml_path, config = _resolve_model_config(season, measurement_period, model_name)
+
     # Import and execute devtooling model
     shared_model_path = os.path.join(eval_algos_dir, 'core', 'models', 'devtooling.py')
-    spec = importlib.util.spec_from_file_location("devtooling_module", shared_model_path)
-    devtooling_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(devtooling_module)
-    
+    devtooling_module = _load_model("devtooling_module", shared_model_path)
+
     # Run simulation
-    analysis = devtooling_module.run_simulation(yaml_path)
+    analysis = devtooling_module.run_simulation(yaml_path, config=config)
     
     # Extract and standardize results
     results = analysis.get('devtooling_project_results')
@@ -139,32 +181,30 @@ def process_devtooling(season: str, measurement_period: str, model_name: str) ->
     if score_column not in results.columns:
         raise ValueError(f"Score column '{score_column}' not found in devtooling results")
     
-    # Filter to only eligible projects with positive scores
-    eligible_results = results[
-        (results['is_eligible'] == 1) & 
-        (results[score_column] > 0)
-    ].copy()
-    
-    if eligible_results.empty:
+    # Filter to only eligible projects with positive scores; comparing on
+    # the raw numpy arrays keeps the AND a single C-level bitwise pass
+    eligible_mask = (results['is_eligible'].to_numpy() == 1) & (results[score_column].to_numpy() > 0)
+
+    if not eligible_mask.any():
         raise ValueError("No eligible projects with positive scores found")
-    
-    # Select and rename columns
-    final_results = eligible_results[[
-        'project_id', 'project_name', 'display_name', score_column
-    ]].copy()
-    final_results.rename(columns={score_column: 'score'}, inplace=True)
-    
-    # Normalize scores to sum to 1.0
-    total_score = final_results['score'].sum()
+
+    # Select, rename, and normalize in a single pass (no intermediate copies)
+    final_results = (
+        results.loc[eligible_mask, ['project_id', 'project_name', 'display_name', score_column]]
+        .rename(columns={score_column: 'score'})
+    )
+    # Normalize with one numpy divide pass over the raw score array
+    scores_arr = final_results['score'].to_numpy(dtype='float64')
+    total_score = scores_arr.sum()
     if total_score > 0:
-        final_results['score'] = final_results['score'] / total_score
-    
+        final_results['score'] = scores_arr / total_score
+
     print(f"✓ Devtooling model executed for {model_name}")
     print(f"  - {len(final_results)} eligible projects found")
     
     # Allocate rewards
     print(f"Allocating rewards for {model_name}...")
-    allocated_results = allocate_rewards(final_results, yaml_path)
+    allocated_results = allocate_rewards(final_results, config, yaml_path)
     
     # Save results
     save_rewards_csv(allocated_results, season, measurement_period, model_name)
@@ -178,17 +218,15 @@ def process_onchain(season: str, measurement_period: str, model_name: str) -> No
     """Complete onchain model workflow: execute, extract results, allocate, and save"""
     print(f"Processing onchain model: {model_name}")
     
-    # Find YAML file
-    yaml_path = find_yaml_file(season, measurement_period, model_name)
-    
+    # Find and parse the YAML file once
+    yaml_path, config = _resolve_model_config(season, measurement_period, model_name)
+
     # Import and execute onchain model
     shared_model_path = os.path.join(eval_algos_dir, 'core', 'models', 'onchain_builders.py')
-    spec = importlib.util.spec_from_file_location("onchain_module", shared_model_path)
-    onchain_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(onchain_module)
-    
+    onchain_module = _load_model("onchain_module", shared_model_path)
+
     # Run simulation
-    analysis = onchain_module.run_simulation(yaml_path)
+    analysis = onchain_module.run_simulation(yaml_path, config=config)
     
     # Extract and standardize results
     results = analysis.get('final_results')
@@ -203,28 +241,28 @@ def process_onchain(season: str, measurement_period: str, model_name: str) -> No
         raise ValueError(f"Score column '{score_column}' not found in onchain results")
     
     # Filter to only projects with positive scores
-    eligible_results = results[results[score_column] > 0].copy()
-    
-    if eligible_results.empty:
+    eligible_mask = results[score_column].to_numpy() > 0
+
+    if not eligible_mask.any():
         raise ValueError("No projects with positive scores found")
-    
-    # Select and rename columns
-    final_results = eligible_results[[
-        'project_id', 'project_name', 'display_name', score_column
-    ]].copy()
-    final_results.rename(columns={score_column: 'score'}, inplace=True)
-    
-    # Normalize scores to sum to 1.0
-    total_score = final_results['score'].sum()
+
+    # Select, rename, and normalize in a single pass (no intermediate copies)
+    final_results = (
+        results.loc[eligible_mask, ['project_id', 'project_name', 'display_name', score_column]]
+        .rename(columns={score_column: 'score'})
+    )
+    # Normalize with one numpy divide pass over the raw score array
+    scores_arr = final_results['score'].to_numpy(dtype='float64')
+    total_score = scores_arr.sum()
     if total_score > 0:
-        final_results['score'] = final_results['score'] / total_score
-    
+        final_results['score'] = scores_arr / total_score
+
     print(f"✓ Onchain model executed for {model_name}")
     print(f"  - {len(final_results)} eligible projects found")
     
     # Allocate rewards
     print(f"Allocating rewards for {model_name}...")
-    allocated_results = allocate_rewards(final_results, yaml_path)
+    allocated_results = allocate_rewards(final_results, config, yaml_path)
     
     # Save results
     save_rewards_csv(allocated_results, season, measurement_period, model_name)
@@ -3,44 +3,115 @@ import sys
 import os
 import pandas as pd
 import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # Add the current directory to the Python path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 eval_algos_dir = os.path.dirname(os.path.dirname(script_dir))
 sys.path.append(eval_algos_dir)
 
-from .config import SeasonConfig
+from .config import SeasonConfig, ensure_dir
 
 
-def clean_json(dataframe: pd.DataFrame) -> str:
+def _null_missing(value):
+    """Recursively replace NaN/NA scalars with None so they encode as null."""
+    if isinstance(value, dict):
+        return {key: _null_missing(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_null_missing(val) for val in value]
+    if value is not None and pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return value
+
+
+def _encode_record(record: dict) -> bytes:
+    """
+    Encode one record as indented JSON bytes (orjson when installed).
+
+    Missing values are nulled first: the stdlib encoder would otherwise emit
+    a bare `NaN` token (invalid JSON), and pandas NA scalars would be
+    stringified by `default=str`.
+    """
+    record = _null_missing(record)
+    if orjson is not None:
+        return orjson.dumps(record,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                            default=str)
+    return json.dumps(record, indent=2, default=str).encode('utf-8')
+
+
+def write_results_json(output_file: str, records: list) -> None:
+    """
+    Stream a list of record dicts to disk as a JSON array.
+
+    Records are encoded and written one at a time — the same shape as the
+    data fetcher's JSON writer — so peak memory stays at one encoded record
+    instead of the whole serialized payload. The array is staged in a
+    temporary file and moved into place with `os.replace`, so readers never
+    observe a partially written results file.
+    """
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(b'[')
+        for idx, record in enumerate(records):
+            if idx:
+                f.write(b',')
+            f.write(b'\n')
+            f.write(_encode_record(record))
+        f.write(b'\n]')
+    os.replace(tmp_file, output_file)
+
+
+@lru_cache(maxsize=32)
+def _paths(season: str, measurement_period: str) -> Dict[str, str]:
+    """Resolve (once) the data/weights/outputs paths for a period."""
+    config = SeasonConfig(season)
+    return config.get_measurement_period_paths(measurement_period)
+
+
+def _read_tabular(csv_path: str, **csv_kwargs) -> Optional[pd.DataFrame]:
     """
-    Convert a pandas DataFrame to a clean JSON string with proper formatting.
+    Read a tabular data file, preferring a Parquet sidecar when present.
+
+    A `<name>.parquet` next to the CSV loads columnar, typed, and
+    multi-threaded — typically 5-20x faster than the CSV parser for the
+    same rows. The CSV remains the source of truth when no sidecar exists.
+    Returns None when neither file is present.
     """
-    json_str = dataframe.to_json(orient='records', indent=2)
-    clean_json_str = json_str.replace('\\/', '/')
-    return clean_json_str
+    parquet_path = csv_path[:-len('.csv')] + '.parquet'
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path, engine='pyarrow')
+    if os.path.exists(csv_path):
+        return pd.read_csv(csv_path, **csv_kwargs)
+    return None
 
 
 def load_consolidated_rewards(season: str, measurement_period: str) -> Optional[pd.DataFrame]:
     """Load the consolidated rewards CSV file."""
-    config = SeasonConfig(season)
-    paths = config.get_measurement_period_paths(measurement_period)
-    outputs_dir = paths['outputs']
+    outputs_dir = _paths(season, measurement_period)['outputs']
     
     consolidated_file = os.path.join(outputs_dir, f"{measurement_period}_consolidated_rewards.csv")
-    if os.path.exists(consolidated_file):
-        return pd.read_csv(consolidated_file)
-    else:
+    # Only three of the consolidated columns are consumed downstream; the
+    # Arrow-backed filename dtype keeps the substring filters in C buffers
+    df = _read_tabular(consolidated_file,
+                       usecols=['op_atlas_id', 'filename', 'op_reward'],
+                       dtype={'op_atlas_id': 'string',
+                              'filename': 'string[pyarrow]',
+                              'op_reward': 'float64'})
+    if df is None:
         print(f"Warning: Consolidated rewards file not found: {consolidated_file}")
-        return None
+    return df
 
 
 def load_metrics_data(season: str, measurement_period: str, model_type: str) -> Optional[pd.DataFrame]:
     """Load metrics data for a specific model type."""
-    config = SeasonConfig(season)
-    paths = config.get_measurement_period_paths(measurement_period)
-    data_dir = paths['data']
+    data_dir = _paths(season, measurement_period)['data']
     
     # Look for metrics files
     if model_type == 'devtooling':
@@ -52,32 +123,46 @@ def load_metrics_data(season: str, measurement_period: str, model_type: str) ->
     
     if os.path.exists(metrics_file):
         if metrics_file.endswith('.json'):
-            with open(metrics_file, 'r') as f:
-                data = json.load(f)
-            return pd.DataFrame(data)
-        else:
-            return pd.read_csv(metrics_file)
-    else:
-        print(f"Warning: Metrics file not found: {metrics_file}")
-        return None
+            # Single-pass parse straight into columns; json.load +
+            # pd.DataFrame would build every record as Python dicts first
+            # and then re-infer dtypes over them
+            return pd.read_json(metrics_file, orient='records')
+
+    if metrics_file.endswith('.csv'):
+        # The grouping/join keys are low-cardinality; building them as
+        # categoricals in the parser means the downstream groupby hashes
+        # small integer codes instead of Python strings. metric_name stays
+        # a plain string column because the onchain serializer remaps S8
+        # names to values that would not be existing categories.
+        df = _read_tabular(metrics_file,
+                           usecols=['project_id', 'project_name', 'display_name',
+                                    'metric_name', 'sample_date', 'amount'],
+                           dtype={'project_name': 'category',
+                                  'display_name': 'category'})
+        if df is not None:
+            return df
+
+    print(f"Warning: Metrics file not found: {metrics_file}")
+    return None
 
 
 def serialize_devtooling_results(season: str, measurement_period: str, df_rewards: Optional[pd.DataFrame] = None) -> None:
     """Serialize devtooling results combining metadata, metrics and rewards data."""
     try:
-        config = SeasonConfig(season)
-        paths = config.get_measurement_period_paths(measurement_period)
+        paths = _paths(season, measurement_period)
         outputs_dir = paths['outputs']
         data_dir = paths['data']
         
-        os.makedirs(outputs_dir, exist_ok=True)
+        ensure_dir(outputs_dir)
         
         # STEP 1: Load project metadata first to get ALL projects with their IDs
         project_metadata_path = os.path.join(data_dir, 'devtooling__project_metadata.csv')
-        if not os.path.exists(project_metadata_path):
+        project_metadata_df = _read_tabular(
+            project_metadata_path,
+            dtype={'project_name': 'string', 'project_id': 'string',
+                   'display_name': 'string'})
+        if project_metadata_df is None:
             raise FileNotFoundError(f"Devtooling project metadata not found: {project_metadata_path}")
-        
-        project_metadata_df = pd.read_csv(project_metadata_path)
         if project_metadata_df.empty:
             print("No devtooling project metadata found")
             return
@@ -92,77 +177,54 @@ def serialize_devtooling_results(season: str, measurement_period: str, df_reward
         if df_rewards is None:
             df_rewards = load_consolidated_rewards(season, measurement_period)
         
-        # Create a lookup for rewards by op_atlas_id
-        rewards_lookup = {}
+        # STEP 3/4: Assemble the final records with hash-joins instead of a
+        # per-project Python loop: left-merge rewards and metrics onto the
+        # metadata frame and convert to records in one pass
+        merged = project_metadata_df[['project_name', 'project_id', 'display_name']].rename(
+            columns={'project_name': 'op_atlas_id', 'project_id': 'oso_project_id'})
+        
+        missing_ids = merged['op_atlas_id'].isna() | merged['oso_project_id'].isna()
+        if missing_ids.any():
+            print(f"Warning: Skipping {int(missing_ids.sum())} projects with missing IDs")
+            merged = merged[~missing_ids]
+        
         if df_rewards is not None:
-            devtooling_mask = df_rewards['filename'].str.contains('devtooling', na=False, case=False)
-            devtooling_rewards = df_rewards[devtooling_mask]
-            
-            if not devtooling_rewards.empty:
-                for _, reward_row in devtooling_rewards.iterrows():
-                    op_atlas_id = reward_row.get('op_atlas_id')
-                    if op_atlas_id:
-                        rewards_lookup[op_atlas_id] = {
-                            'op_reward': reward_row.get('op_reward', 0)
-                        }
+            devtooling_mask = df_rewards['filename'].str.contains('devtooling', na=False, case=False, regex=False)
+            rewards_df = (df_rewards.loc[devtooling_mask, ['op_atlas_id', 'op_reward']]
+                          .dropna(subset=['op_atlas_id'])
+                          .drop_duplicates('op_atlas_id'))
+            merged = merged.merge(rewards_df, on='op_atlas_id', how='left')
+            merged['op_reward'] = merged['op_reward'].fillna(0)
+        else:
+            merged['op_reward'] = 0
+        merged['round_id'] = str(season)
         
-        # STEP 3: Load devtooling metrics
+        # Metrics carry the authoritative is_eligible flag plus any extra
+        # metric columns; fields the metadata already provides are dropped
         metrics_df = load_metrics_data(season, measurement_period, 'devtooling')
-        
-        # Create a lookup for metrics by op_atlas_id
-        metrics_lookup = {}
         if metrics_df is not None:
-            for _, metrics_row in metrics_df.iterrows():
-                op_atlas_id = metrics_row.get('project_name')  # This is op_atlas_id
-                if op_atlas_id:
-                    metrics_lookup[op_atlas_id] = metrics_row.to_dict()
+            metrics_cols = metrics_df.rename(columns={'project_name': 'op_atlas_id'})
+            redundant = [col for col in metrics_cols.columns
+                         if col != 'op_atlas_id' and col in merged.columns] + ['project_id']
+            metrics_cols = (metrics_cols
+                            .drop(columns=redundant, errors='ignore')
+                            .dropna(subset=['op_atlas_id'])
+                            .drop_duplicates('op_atlas_id'))
+            merged = merged.merge(metrics_cols, on='op_atlas_id', how='left')
+        if 'is_eligible' in merged.columns:
+            merged['is_eligible'] = merged['is_eligible'].fillna(True)
+        else:
+            merged['is_eligible'] = True
         
-        # STEP 4: Create the final JSON structure - include ALL projects from metadata
-        results = []
-        for _, metadata_row in project_metadata_df.iterrows():
-            op_atlas_id = metadata_row.get('project_name')  # This is op_atlas_id
-            oso_project_id = metadata_row.get('project_id')
-            display_name = metadata_row.get('display_name', '')
-            
-            # Ensure we have both IDs
-            if not op_atlas_id or not oso_project_id:
-                print(f"Warning: Missing IDs for project - op_atlas_id: {op_atlas_id}, oso_project_id: {oso_project_id}")
-                continue
-            
-            # Get reward data if available, otherwise use defaults
-            reward_data = rewards_lookup.get(op_atlas_id, {
-                'op_reward': 0
-            })
-            
-            # Get metrics data if available
-            metrics_data = metrics_lookup.get(op_atlas_id, {})
-            
-            # Get eligibility from metrics data (which has the correct eligibility info)
-            is_eligible = metrics_data.get('is_eligible', True)
-            
-            result = {
-                'op_atlas_id': op_atlas_id,
-                'oso_project_id': oso_project_id,
-                'display_name': display_name,
-                'is_eligible': is_eligible,
-                'op_reward': reward_data['op_reward'],
-                'round_id': str(season)
-            }
-            
-            # Add all metrics data (excluding redundant fields)
-            for col, value in metrics_data.items():
-                if col not in result and col not in ['project_name', 'project_id']:
-                    result[col] = value
-            
-            results.append(result)
+        # Keep the established field order in the output JSON
+        front = ['op_atlas_id', 'oso_project_id', 'display_name', 'is_eligible',
+                 'op_reward', 'round_id']
+        merged = merged[front + [col for col in merged.columns if col not in front]]
+        results = merged.to_dict(orient='records')
         
-        # Save to JSON file
+        # Save to JSON file, streaming the records directly
         output_file = os.path.join(outputs_dir, 'devtooling__results.json')
-        # Convert results to DataFrame for clean JSON formatting
-        results_df = pd.DataFrame(results)
-        clean_json_str = clean_json(results_df)
-        with open(output_file, 'w') as f:
-            f.write(clean_json_str)
+        write_results_json(output_file, results)
         
         print(f"✓ Devtooling results serialized to {output_file} ({len(results)} projects)")
         
@@ -173,19 +235,21 @@ def serialize_devtooling_results(season: str, measurement_period: str, df_reward
 
 def serialize_onchain_results(season: str, measurement_period: str, df_rewards: Optional[pd.DataFrame] = None) -> None:
     """Serialize onchain results combining metadata, metrics and rewards data."""
-    config = SeasonConfig(season)
-    paths = config.get_measurement_period_paths(measurement_period)
+    paths = _paths(season, measurement_period)
     outputs_dir = paths['outputs']
     data_dir = paths['data']
     
-    os.makedirs(outputs_dir, exist_ok=True)
+    ensure_dir(outputs_dir)
     
     # STEP 1: Load project metadata first to get ALL projects with their IDs
     project_metadata_path = os.path.join(data_dir, 'onchain__project_metadata.csv')
-    if not os.path.exists(project_metadata_path):
+    project_metadata_df = _read_tabular(
+        project_metadata_path,
+        dtype={'project_name': 'string', 'project_id': 'string',
+               'display_name': 'string', 'is_eligible': 'boolean',
+               'transaction_count': 'Int64', 'active_days': 'Int64'})
+    if project_metadata_df is None:
         raise FileNotFoundError(f"Onchain project metadata not found: {project_metadata_path}")
-    
-    project_metadata_df = pd.read_csv(project_metadata_path)
     if project_metadata_df.empty:
         print("No onchain project metadata found")
         return
@@ -200,19 +264,18 @@ def serialize_onchain_results(season: str, measurement_period: str, df_rewards:
     if df_rewards is None:
         df_rewards = load_consolidated_rewards(season, measurement_period)
     
-    # Create a lookup for rewards by op_atlas_id
+    # Create a lookup for rewards by op_atlas_id in one vectorized pass
     rewards_lookup = {}
     if df_rewards is not None:
-        onchain_mask = df_rewards['filename'].str.contains('onchain', na=False, case=False)
+        onchain_mask = df_rewards['filename'].str.contains('onchain', na=False, case=False, regex=False)
         onchain_rewards = df_rewards[onchain_mask]
         
         if not onchain_rewards.empty:
-            for _, reward_row in onchain_rewards.iterrows():
-                op_atlas_id = reward_row.get('op_atlas_id')
-                if op_atlas_id:
-                    rewards_lookup[op_atlas_id] = {
-                        'op_reward': reward_row.get('op_reward', 0)
-                    }
+            rewards_lookup = (onchain_rewards
+                              .dropna(subset=['op_atlas_id'])
+                              .set_index('op_atlas_id')['op_reward']
+                              .fillna(0)
+                              .to_dict())
     
     # STEP 3: Load and process onchain metrics
     metrics_df = load_metrics_data(season, measurement_period, 'onchain')
@@ -221,56 +284,53 @@ def serialize_onchain_results(season: str, measurement_period: str, df_rewards:
     processed_metrics = {}
     if metrics_df is not None:
         try:
-            # Group metrics by project and create nested structure
-            # Filter to only most recent measurement period
+            # One columnar pass: keep the most recent measurement period,
+            # drop NaN amounts and the metrics S8 no longer reports, remap
+            # S8 metric names to the S7 format (worldchain users fold into
+            # the active-addresses aggregation), then sum per project/metric
             current_period = metrics_df['sample_date'].max()
-            filtered_metrics = metrics_df[metrics_df['sample_date'] == current_period]
-            
-            for _, row in filtered_metrics.iterrows():
-                project_name = row['project_name']  # This is op_atlas_id
-                if project_name not in processed_metrics:
-                    processed_metrics[project_name] = {
-                        'project_id': row['project_id'],
-                        'display_name': row['display_name'],
-                        'eligibility_metrics': {},
-                        'monthly_metrics': {
-                            'defillama_tvl': 0
-                        }
-                    }
-                
-                # Add to monthly_metrics with S8-specific mapping and sum aggregation
-                metric_name = row['metric_name']
-                amount = row['amount']
-                if pd.notna(amount):
-                    # Map S8 metric names to S7 format
-                    if metric_name == 'layer2_gas_fees_amortized':
-                        target_metric = 'gas_fees'
-                    elif metric_name in ['farcaster_users', 'layer2_gas_fees']:
-                        # Skip these metrics for S8
-                        continue
-                    elif metric_name == 'worldchain_users_aggregation':
-                        # Combine worldchain_users_aggregation with active_addresses_aggregation
-                        target_metric = 'active_addresses_aggregation'
-                    else:
-                        target_metric = metric_name
-                    
-                    # Sum the metric values
-                    if target_metric in processed_metrics[project_name]['monthly_metrics']:
-                        processed_metrics[project_name]['monthly_metrics'][target_metric] += amount
-                    else:
-                        processed_metrics[project_name]['monthly_metrics'][target_metric] = amount
+            filtered_metrics = metrics_df[
+                metrics_df['sample_date'].eq(current_period)
+                & metrics_df['amount'].notna()
+                & ~metrics_df['metric_name'].isin(['farcaster_users', 'layer2_gas_fees'])
+            ].copy()
+            filtered_metrics['metric_name'] = filtered_metrics['metric_name'].replace({
+                'layer2_gas_fees_amortized': 'gas_fees',
+                'worldchain_users_aggregation': 'active_addresses_aggregation',
+            })
+            metric_sums = (filtered_metrics
+                           .groupby(['project_name', 'metric_name'], sort=False, observed=True)['amount']
+                           .sum())
+            project_info = (filtered_metrics
+                            .drop_duplicates('project_name')
+                            .set_index('project_name'))
+            for project_name, sums in metric_sums.groupby(level=0, sort=False):
+                monthly_metrics = sums.droplevel(0).to_dict()
+                # Missing or zero TVL is reported as null downstream
+                if not monthly_metrics.get('defillama_tvl'):
+                    monthly_metrics['defillama_tvl'] = None
+                info = project_info.loc[project_name]
+                processed_metrics[project_name] = {
+                    'project_id': info['project_id'],
+                    'display_name': info['display_name'],
+                    'eligibility_metrics': {},
+                    'monthly_metrics': monthly_metrics
+                }
         except Exception as e:
             print(f"Error processing onchain metrics: {e}")
     
-    # Add eligibility metrics from project metadata to processed_metrics
-    for _, row in project_metadata_df.iterrows():
+    # Add eligibility metrics from project metadata to processed_metrics.
+    # to_dict(orient='records') converts the frame once at the C level and
+    # yields plain dicts, avoiding a boxed Series per row.
+    metadata_records = project_metadata_df.to_dict(orient='records')
+    for row in metadata_records:
         project_name = row['project_name']  # This is op_atlas_id
         if project_name not in processed_metrics:
             processed_metrics[project_name] = {
                 'project_id': row['project_id'],
                 'display_name': row['display_name'],
                 'eligibility_metrics': {},
-                'monthly_metrics': {'defillama_tvl': 0}
+                'monthly_metrics': {'defillama_tvl': None}
             }
         
         # Add eligibility metrics
@@ -281,7 +341,7 @@ def serialize_onchain_results(season: str, measurement_period: str, df_rewards:
     
     # STEP 4: Create the final JSON structure - include ALL projects from metadata
     results = []
-    for _, metadata_row in project_metadata_df.iterrows():
+    for metadata_row in metadata_records:
         op_atlas_id = metadata_row.get('project_name')  # This is op_atlas_id
         oso_project_id = metadata_row.get('project_id')
         display_name = metadata_row.get('display_name', '')
@@ -291,18 +351,13 @@ def serialize_onchain_results(season: str, measurement_period: str, df_rewards:
             print(f"Warning: Missing IDs for project - op_atlas_id: {op_atlas_id}, oso_project_id: {oso_project_id}")
             continue
         
-        # Get reward data if available, otherwise use defaults
-        reward_data = rewards_lookup.get(op_atlas_id, {
-            'op_reward': 0
-        })
-        
         # Get eligibility from metadata
         is_eligible = metadata_row.get('is_eligible', True)
         
         # Get processed metrics data if available
         metrics_data = processed_metrics.get(op_atlas_id, {
             'eligibility_metrics': {},
-            'monthly_metrics': {'defillama_tvl': 0}
+            'monthly_metrics': {'defillama_tvl': None}
         })
         
         result = {
@@ -310,42 +365,42 @@ def serialize_onchain_results(season: str, measurement_period: str, df_rewards:
             'op_atlas_id': op_atlas_id,
             'display_name': display_name,
             'is_eligible': is_eligible,
-            'op_reward': reward_data['op_reward'],
+            'op_reward': rewards_lookup.get(op_atlas_id, 0),
             'round_id': str(season),
             'eligibility_metrics': metrics_data['eligibility_metrics'],
             'monthly_metrics': metrics_data['monthly_metrics']
         }
         
-        # Ensure defillama_tvl is always present (set to null if not found or zero)
-        if 'monthly_metrics' in result and isinstance(result['monthly_metrics'], dict):
-            if 'defillama_tvl' not in result['monthly_metrics']:
-                result['monthly_metrics']['defillama_tvl'] = None
-            elif result['monthly_metrics']['defillama_tvl'] == 0:
-                result['monthly_metrics']['defillama_tvl'] = None
-        else:
-            # If no monthly_metrics at all, create it with defillama_tvl
-            result['monthly_metrics'] = {'defillama_tvl': None}
-        
         results.append(result)
     
-    # Save to JSON file
+    # Save to JSON file, streaming the records directly
     output_file = os.path.join(outputs_dir, 'onchain__results.json')
-    # Convert results to DataFrame for clean JSON formatting
-    results_df = pd.DataFrame(results)
-    clean_json_str = clean_json(results_df)
-    with open(output_file, 'w') as f:
-        f.write(clean_json_str)
+    write_results_json(output_file, results)
     
     print(f"✓ Onchain results serialized to {output_file} ({len(results)} projects)")
 
 
 def serialize_results(season: str, measurement_period: str) -> None:
-    """Serialize all results for a specific season and measurement period."""
-    print(f"Serializing devtooling results for S{season} - {measurement_period}...")
-    serialize_devtooling_results(season, measurement_period)
-    
-    print(f"Serializing onchain results for S{season} - {measurement_period}...")
-    serialize_onchain_results(season, measurement_period)
+    """
+    Serialize all results for a specific season and measurement period.
+
+    The devtooling and onchain serializations are independent and mostly
+    file I/O, so they run concurrently; wall time is the slower of the two
+    rather than their sum.
+    """
+    print(f"Serializing devtooling and onchain results for S{season} - {measurement_period}...")
+    # Parse the consolidated rewards once and hand the same snapshot to both
+    # serializers instead of each re-reading the CSV
+    df_rewards = load_consolidated_rewards(season, measurement_period)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(serialize_devtooling_results, season, measurement_period,
+                            df_rewards=df_rewards),
+            executor.submit(serialize_onchain_results, season, measurement_period,
+                            df_rewards=df_rewards),
+        ]
+        for future in futures:
+            future.result()
     
     print(f"✓ All results serialized for S{season} - {measurement_period}")
 
@@ -0,0 +1,14 @@
+"""
+Shared helpers for the season query modules.
+"""
+
+
+def stringify(values):
+    """
+    Render a list of values as a quoted SQL IN-list.
+
+    The OSO API accepts a single SQL string and has no bind-parameter
+    support, so list literals are rendered client-side in one place.
+    Single quotes are escaped so the rendered literal stays well-formed.
+    """
+    return "'" + "','".join(str(v).replace("'", "''") for v in values) + "'"
@@ -1,13 +1,14 @@
 """
 This module contains all the SQL queries used to fetch data from OSO.
+
+Queries are rendered by `build_queries` from the date presets in `PERIODS`;
+`QUERIES` is rendered once at import time for the current period, and other
+configured periods can be built on demand without editing module constants.
 """
 
+from . import stringify
+
 THIS_PERIOD = 'M6'
-THIS_PERIOD_NUMBER = THIS_PERIOD[-1]
-START_DATE = '2024-11-01'
-END_DATE = '2025-08-01'
-THIS_PERIOD_DATE = '2025-07-01'
-LAST_PERIOD_DATE = '2025-06-01'
 FLAG_LIST = [
     '0xaa1b878800206da24ee7297fb202ef98a6af0fb3ec298a65ba6b675cb4f4144b', # Test Project
     '0x482720e73e91229b5f7d5e2d80a54eb8a722309c26dba03355359788b18f4373', # M4 RubyScore (manufactured activity)
@@ -27,58 +28,108 @@ METRICS = [
     'contract_invocations_upgraded_eoa_monthly',
 ]
 
-stringify = lambda arr: "'" + "','".join(arr) + "'"
+# Date constants per measurement period; add an entry here when a new period opens
+PERIODS = {
+    'M5': {
+        'start_date': '2024-11-01',
+        'end_date': '2025-07-01',
+        'this_period_date': '2025-06-01',
+        'last_period_date': '2025-05-01',
+    },
+    'M6': {
+        'start_date': '2024-11-01',
+        'end_date': '2025-08-01',
+        'this_period_date': '2025-07-01',
+        'last_period_date': '2025-06-01',
+    },
+}
+
+
+def build_queries(period: str = THIS_PERIOD,
+                  start_date: str = None,
+                  end_date: str = None,
+                  this_period_date: str = None,
+                  last_period_date: str = None,
+                  flag_list: list = FLAG_LIST,
+                  transitive_list: list = TRANSITIVE_DEPENDENCY_LIST,
+                  metrics: list = METRICS) -> tuple:
+    """
+    Render the query list for a measurement period.
 
-QUERIES = [
-    {
-        "filename": "onchain__project_metadata",
-        "filetype": "csv",
-        "query": f"""
+    Dates default to the `PERIODS` preset for the given period, so callers can
+    run any configured period (or override individual dates) without editing
+    module-level constants.
+    """
+    preset = PERIODS.get(period, {})
+    start_date = start_date or preset['start_date']
+    end_date = end_date or preset['end_date']
+    this_period_date = this_period_date or preset['this_period_date']
+    last_period_date = last_period_date or preset['last_period_date']
+    period_number = period[-1]
+
+    # Shared join of the project registry against this period's collection. The
+    # onchain queries below reference this CTE instead of each re-joining
+    # projects_v1 and projects_by_collection_v1 server-side.
+    eligible_projects_cte = f"""
+            eligible_projects AS (
+                SELECT
+                    p.project_id,
+                    p.project_name,
+                    p.display_name,
+                    pbc.project_name AS collection_project_name
+                FROM projects_v1 AS p
+                JOIN projects_by_collection_v1 AS pbc ON p.project_id = pbc.project_id
+                WHERE pbc.collection_name = '8-{period_number}'
+            )"""
+
+    return (
+        {
+            "filename": "onchain__project_metadata",
+            "filetype": "csv",
+            "query": f"""
+            WITH {eligible_projects_cte}
             SELECT
-                p.project_id,
-                p.project_name,
-                p.display_name,
+                ep.project_id,
+                ep.project_name,
+                ep.display_name,
                 e.transaction_count,
                 e.gas_fees,
                 e.active_days,
-                (e.meets_all_criteria AND NOT (p.project_name IN ({stringify(FLAG_LIST)}))) AS is_eligible
+                (e.meets_all_criteria AND NOT (ep.project_name IN ({stringify(flag_list)}))) AS is_eligible
             FROM int_superchain_s7_onchain_builder_eligibility AS e
-            JOIN projects_v1 AS p ON e.project_id = p.project_id
-            JOIN projects_by_collection_v1 AS pbc ON p.project_id = pbc.project_id
+            JOIN eligible_projects AS ep ON e.project_id = ep.project_id
             WHERE
-                pbc.collection_name = '8-{THIS_PERIOD_NUMBER}'
-                AND e.sample_date = DATE '{THIS_PERIOD_DATE}'
+                e.sample_date = DATE '{this_period_date}'
             ORDER BY e.transaction_count DESC
         """
-    },
-    {
-        "filename": "onchain__metrics_by_project",
-        "filetype": "csv",
-        "query": f"""
+        },
+        {
+            "filename": "onchain__metrics_by_project",
+            "filetype": "csv",
+            "query": f"""
+            WITH {eligible_projects_cte}
             SELECT
                 m.project_id,
-                p.display_name,
-                pbc.project_name,
+                ep.display_name,
+                ep.collection_project_name AS project_name,
                 m.chain,
                 m.metric_name,
                 DATE_FORMAT(m.sample_date, '%Y-%m-%d') AS sample_date,
                 DATE_FORMAT(m.sample_date, '%b %Y') AS measurement_period,
                 m.amount
             FROM int_superchain_s7_onchain_metrics_by_project AS m
-            JOIN projects_by_collection_v1 AS pbc ON m.project_id = pbc.project_id
-            JOIN projects_v1 AS p ON pbc.project_id = p.project_id
+            JOIN eligible_projects AS ep ON m.project_id = ep.project_id
             WHERE
-                pbc.collection_name = '8-{THIS_PERIOD_NUMBER}'
-                AND m.sample_date >= DATE ('{LAST_PERIOD_DATE}')
-                AND m.sample_date < DATE '{END_DATE}'
-                AND m.metric_name IN ({stringify(METRICS)})
+                m.sample_date >= DATE ('{last_period_date}')
+                AND m.sample_date < DATE '{end_date}'
+                AND m.metric_name IN ({stringify(metrics)})
         """
-    },
-    {
-        "filename": "devtooling__project_metadata",
-        "filetype": "csv",
-        "query": f"""
-            SELECT 
+        },
+        {
+            "filename": "devtooling__project_metadata",
+            "filetype": "csv",
+            "query": f"""
+            SELECT
                 project_id,
                 project_name,
                 display_name,
@@ -88,11 +139,11 @@ QUERIES = [
             FROM int_superchain_s7_devtooling_metrics_by_project
             ORDER BY fork_count DESC
         """
-    },
-    {
-        "filename": "devtooling__onchain_metadata",
-        "filetype": "csv",
-        "query": f"""
+        },
+        {
+            "filename": "devtooling__onchain_metadata",
+            "filetype": "csv",
+            "query": f"""
             SELECT DISTINCT
                 b.project_id,
                 p.project_name,
@@ -104,46 +155,46 @@ QUERIES = [
             GROUP BY 1, 2, 3
             ORDER BY 4 DESC
         """
-    },
-    {
-        "filename": "devtooling__dependency_graph",
-        "filetype": "csv",
-        "query": f"""
+        },
+        {
+            "filename": "devtooling__dependency_graph",
+            "filetype": "csv",
+            "query": f"""
             SELECT
               onchain_builder_project_id,
               devtooling_project_id,
               CASE
-                WHEN devtooling_project_id IN ({stringify(TRANSITIVE_DEPENDENCY_LIST)})
+                WHEN devtooling_project_id IN ({stringify(transitive_list)})
                   AND dependency_source = 'NPM'
                 THEN 'NPM_TRANSITIVE'
                 ELSE dependency_source
               END AS dependency_source
             FROM int_superchain_s7_devtooling_deps_to_projects_graph
         """
-    },
-    {
-        "filename": "devtooling__developer_graph",
-        "filetype": "csv",
-        "query": f"""
+        },
+        {
+            "filename": "devtooling__developer_graph",
+            "filetype": "csv",
+            "query": f"""
             SELECT *
             FROM int_superchain_s7_devtooling_devs_to_projects_graph
             WHERE project_id != '8Cgztczct8fnsJW6D2OQcFRY6nClKNyOC7Le0soED94='
         """
-    },
-    {
-        "filename": "devtooling__raw_metrics",
-        "filetype": "json",
-        "query": f"""
-            SELECT * 
+        },
+        {
+            "filename": "devtooling__raw_metrics",
+            "filetype": "json",
+            "query": f"""
+            SELECT *
             FROM int_superchain_s7_devtooling_metrics_by_project
         """
-    },
-    {
-        "filename": "onchain__summary_metric_snapshot",
-        "filetype": "csv",
-        "query": f"""
+        },
+        {
+            "filename": "onchain__summary_metric_snapshot",
+            "filetype": "csv",
+            "query": f"""
             WITH params AS (
-                SELECT DATE '{THIS_PERIOD_DATE}' AS month_start
+                SELECT DATE '{this_period_date}' AS month_start
             )
             SELECT
                 tm.project_id,
@@ -160,7 +211,7 @@ QUERIES = [
                       '_'
                     )
                 ) || '__' ||
-                LOWER(DATE_FORMAT(tm.sample_date, '%b')) || '_' || 
+                LOWER(DATE_FORMAT(tm.sample_date, '%b')) || '_' ||
                 DATE_FORMAT(tm.sample_date, '%Y')
                 AS metric_name,
 
@@ -195,5 +246,8 @@ QUERIES = [
             )
             GROUP BY 1, 2, 3, 4, 5
         """
-    }
-] 
\ No newline at end of file
+        }
+    )
+
+
+QUERIES = build_queries(THIS_PERIOD)
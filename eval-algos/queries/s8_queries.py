@@ -1,13 +1,14 @@
 """
 This module contains all the SQL queries used to fetch data from OSO.
+
+Queries are rendered by `build_queries` from the date presets in `PERIODS`;
+`QUERIES` is rendered once at import time for the current period, and other
+configured periods can be built on demand without editing module constants.
 """
 
+from . import stringify
+
 THIS_PERIOD = 'M11'
-THIS_PERIOD_NUMBER = THIS_PERIOD[1:]
-START_DATE = '2024-11-01'
-END_DATE = '2026-01-01'
-THIS_PERIOD_DATE = '2025-12-01'
-LAST_PERIOD_DATE = '2025-11-01'
 FLAG_LIST = [
     '0xaa1b878800206da24ee7297fb202ef98a6af0fb3ec298a65ba6b675cb4f4144b', # Test Project
     '0x482720e73e91229b5f7d5e2d80a54eb8a722309c26dba03355359788b18f4373', # M4 RubyScore (manufactured activity)
@@ -19,64 +20,113 @@ TRANSITIVE_DEPENDENCY_LIST = [
     'ISJwb3A6NNTyxbFJnVHANLlnawWh8kDARUXf4HZTd3s=', # ethereum-bloom-filters
 ]
 
-stringify = lambda arr: "'" + "','".join(arr) + "'"
+# Date constants per measurement period; add an entry here when a new period opens
+PERIODS = {
+    'M10': {
+        'start_date': '2024-11-01',
+        'end_date': '2025-12-01',
+        'this_period_date': '2025-11-01',
+        'last_period_date': '2025-10-01',
+    },
+    'M11': {
+        'start_date': '2024-11-01',
+        'end_date': '2026-01-01',
+        'this_period_date': '2025-12-01',
+        'last_period_date': '2025-11-01',
+    },
+}
+
+
+def build_queries(period: str = THIS_PERIOD,
+                  start_date: str = None,
+                  end_date: str = None,
+                  this_period_date: str = None,
+                  last_period_date: str = None,
+                  flag_list: list = FLAG_LIST,
+                  transitive_list: list = TRANSITIVE_DEPENDENCY_LIST) -> tuple:
+    """
+    Render the query list for a measurement period.
 
-QUERIES = [
-    {
-        "filename": "onchain__project_metadata",
-        "filetype": "csv",
-        "query": f"""
+    Dates default to the `PERIODS` preset for the given period, so callers can
+    run any configured period (or override individual dates) without editing
+    module-level constants.
+    """
+    preset = PERIODS.get(period, {})
+    start_date = start_date or preset['start_date']
+    end_date = end_date or preset['end_date']
+    this_period_date = this_period_date or preset['this_period_date']
+    last_period_date = last_period_date or preset['last_period_date']
+    period_number = period[1:]
+
+    # Shared join of the project registry against this period's collection. The
+    # onchain queries below reference this CTE instead of each re-joining
+    # projects_v1 and projects_by_collection_v1 server-side.
+    eligible_projects_cte = f"""
+            eligible_projects AS (
+                SELECT
+                    p.project_id,
+                    p.project_name,
+                    p.display_name,
+                    pbc.project_name AS collection_project_name
+                FROM projects_v1 AS p
+                JOIN projects_by_collection_v1 AS pbc ON p.project_id = pbc.project_id
+                WHERE pbc.collection_name = '8-{period_number}'
+            )"""
+
+    return (
+        {
+            "filename": "onchain__project_metadata",
+            "filetype": "csv",
+            "query": f"""
+            WITH {eligible_projects_cte}
             SELECT
-                p.project_id,
-                p.project_name,
-                p.display_name,
+                ep.project_id,
+                ep.project_name,
+                ep.display_name,
                 e.transaction_count,
                 e.active_days,
-                (e.meets_all_criteria AND NOT (p.project_name IN ({stringify(FLAG_LIST)}))) AS is_eligible
+                (e.meets_all_criteria AND NOT (ep.project_name IN ({stringify(flag_list)}))) AS is_eligible
             FROM int_superchain_s8_onchain_builder_eligibility AS e
-            JOIN projects_v1 AS p ON e.project_id = p.project_id
-            JOIN projects_by_collection_v1 AS pbc ON p.project_id = pbc.project_id
+            JOIN eligible_projects AS ep ON e.project_id = ep.project_id
             WHERE
-                pbc.collection_name = '8-{THIS_PERIOD_NUMBER}'
-                AND e.sample_date = DATE '{THIS_PERIOD_DATE}'
+                e.sample_date = DATE '{this_period_date}'
             ORDER BY e.transaction_count DESC
         """
-    },
-    {
-        "filename": "onchain__metrics_by_project",
-        "filetype": "csv",
-        "query": f"""
+        },
+        {
+            "filename": "onchain__metrics_by_project",
+            "filetype": "csv",
+            "query": f"""
+            WITH {eligible_projects_cte}
             SELECT
                 m.project_id,
-                p.display_name,
-                pbc.project_name,
+                ep.display_name,
+                ep.collection_project_name AS project_name,
                 m.chain,
                 m.metric_name,
                 DATE_FORMAT(m.sample_date, '%Y-%m-%d') AS sample_date,
                 DATE_FORMAT(m.sample_date, '%b %Y') AS measurement_period,
                 m.amount
             FROM int_superchain_s8_onchain_metrics_by_project AS m
-            JOIN projects_by_collection_v1 AS pbc ON m.project_id = pbc.project_id
-            JOIN projects_v1 AS p ON pbc.project_id = p.project_id
+            JOIN eligible_projects AS ep ON m.project_id = ep.project_id
             WHERE
-                pbc.collection_name = '8-{THIS_PERIOD_NUMBER}'
-                AND m.sample_date >= DATE ('{LAST_PERIOD_DATE}')
-                AND m.sample_date < DATE '{END_DATE}'
+                m.sample_date >= DATE ('{last_period_date}')
+                AND m.sample_date < DATE '{end_date}'
                 AND (
-                    pbc.project_name != '0x9d9162fac637991d2a56da8fbe03dba24c87eb82d47c7a00b921e39e956f8a9d'
+                    ep.collection_project_name != '0x9d9162fac637991d2a56da8fbe03dba24c87eb82d47c7a00b921e39e956f8a9d'
                     OR NOT (
                        m.metric_name = 'defillama_tvl'
                        AND m.chain NOT IN ('LISK', 'BOB')
                     )
                 )
         """
-    },
-    {
-        "filename": "devtooling__project_metadata",
-        "filetype": "csv",
-        "query": f"""
-            SELECT 
-                -- {THIS_PERIOD}
+        },
+        {
+            "filename": "devtooling__project_metadata",
+            "filetype": "csv",
+            "query": f"""
+            SELECT
+                -- {period}
                 project_id,
                 project_name,
                 display_name,
@@ -86,13 +136,13 @@ QUERIES = [
             FROM int_superchain_s8_devtooling_metrics_by_project
             ORDER BY fork_count DESC
         """
-    },
-    {
-        "filename": "devtooling__onchain_metadata",
-        "filetype": "csv",
-        "query": f"""
+        },
+        {
+            "filename": "devtooling__onchain_metadata",
+            "filetype": "csv",
+            "query": f"""
             SELECT DISTINCT
-                -- {THIS_PERIOD}
+                -- {period}
                 b.project_id,
                 p.project_name,
                 p.display_name,
@@ -103,41 +153,44 @@ QUERIES = [
             GROUP BY 1, 2, 3
             ORDER BY 4 DESC
         """
-    },
-    {
-        "filename": "devtooling__dependency_graph",
-        "filetype": "csv",
-        "query": f"""
+        },
+        {
+            "filename": "devtooling__dependency_graph",
+            "filetype": "csv",
+            "query": f"""
             SELECT
-              -- {THIS_PERIOD}
+              -- {period}
               onchain_builder_project_id,
               devtooling_project_id,
               CASE
-                WHEN devtooling_project_id IN ({stringify(TRANSITIVE_DEPENDENCY_LIST)})
+                WHEN devtooling_project_id IN ({stringify(transitive_list)})
                   AND dependency_source = 'NPM'
                 THEN 'NPM_TRANSITIVE'
                 ELSE dependency_source
               END AS dependency_source
             FROM int_superchain_s8_devtooling_deps_to_projects_graph
         """
-    },
-    {
-        "filename": "devtooling__developer_graph",
-        "filetype": "csv",
-        "query": f"""
-            -- {THIS_PERIOD}
+        },
+        {
+            "filename": "devtooling__developer_graph",
+            "filetype": "csv",
+            "query": f"""
+            -- {period}
             SELECT *
             FROM int_superchain_s8_devtooling_devs_to_projects_graph
             WHERE project_id != '8Cgztczct8fnsJW6D2OQcFRY6nClKNyOC7Le0soED94='
         """
-    },
-    {
-        "filename": "devtooling__raw_metrics",
-        "filetype": "json",
-        "query": f"""
-            -- {THIS_PERIOD}
-            SELECT * 
+        },
+        {
+            "filename": "devtooling__raw_metrics",
+            "filetype": "json",
+            "query": f"""
+            -- {period}
+            SELECT *
             FROM int_superchain_s8_devtooling_metrics_by_project
         """
-    }
-] 
\ No newline at end of file
+        }
+    )
+
+
+QUERIES = build_queries(THIS_PERIOD)